@@ -45,11 +45,12 @@ print("\n" + "=" * 80)
 print("COMPLETE COLUMN LIST (matching R tidyxl package):")
 print("=" * 80)
 
-# Show all columns and their types
+# Show all columns and their types. first_valid_index locates one non-null
+# value per column at C level instead of materializing a dropna copy of
+# every column.
 for i, col in enumerate(cells.columns, 1):
-    # Get sample non-null value for type demonstration
-    sample_vals = cells[col].dropna()
-    sample_type = type(sample_vals.iloc[0]).__name__ if len(sample_vals) > 0 else 'None'
+    idx = cells[col].first_valid_index()
+    sample_type = type(cells.at[idx, col]).__name__ if idx is not None else 'None'
 
     print(f"{i:2d}. {col:<20} ({sample_type})")
 
@@ -67,30 +68,28 @@ print("\n" + "=" * 80)
 print("DATA TYPE EXAMPLES:")
 print("=" * 80)
 
-# Show examples of each data type
-data_types = cells['data_type'].unique()
-for dtype in data_types:
-    subset = cells[cells['data_type'] == dtype].head(1)
-    if len(subset) > 0:
-        row = subset.iloc[0]
-        print(f"\n{dtype.upper()} example:")
-        print(f"  Address: {row['address']}")
-        print(f"  Content: {row['content']}")
-        print(f"  is_blank: {row['is_blank']}")
-
-        # Show the typed value columns
-        if row['logical'] is not None:
-            print(f"  logical: {row['logical']}")
-        if row['numeric'] is not None:
-            print(f"  numeric: {row['numeric']}")
-        if row['date'] is not None:
-            print(f"  date: {row['date']}")
-        if row['character'] is not None:
-            print(f"  character: {row['character']}")
-        if row['error'] is not None:
-            print(f"  error: {row['error']}")
-        if row['formula'] is not None:
-            print(f"  formula: {row['formula']}")
+# Show examples of each data type. One groupby pass picks the first cell
+# of every type instead of re-scanning the whole frame per type.
+for _, row in cells.groupby('data_type', sort=False).head(1).iterrows():
+    dtype = row['data_type']
+    print(f"\n{dtype.upper()} example:")
+    print(f"  Address: {row['address']}")
+    print(f"  Content: {row['content']}")
+    print(f"  is_blank: {row['is_blank']}")
+
+    # Show the typed value columns (masked dtypes use pd.NA, not None)
+    if pd.notna(row['logical']):
+        print(f"  logical: {row['logical']}")
+    if pd.notna(row['numeric']):
+        print(f"  numeric: {row['numeric']}")
+    if pd.notna(row['date']):
+        print(f"  date: {row['date']}")
+    if pd.notna(row['character']):
+        print(f"  character: {row['character']}")
+    if pd.notna(row['error']):
+        print(f"  error: {row['error']}")
+    if pd.notna(row['formula']):
+        print(f"  formula: {row['formula']}")
 
 print("\n" + "=" * 80)
 print("COLUMN MAPPING TO R TIDYXL:")
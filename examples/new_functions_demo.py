@@ -17,11 +17,11 @@ print("=" * 80)
 # Create a comprehensive test Excel file with named ranges and validation
 print("Creating test Excel file with named ranges and data validation...")
 
-wb = Workbook()
+# Write-only mode streams whole rows to XML without building cell objects
+wb = Workbook(write_only=True)
 
 # Sheet 1: Main data with named ranges
-ws1 = wb.active
-ws1.title = "Sales_Data"
+ws1 = wb.create_sheet("Sales_Data")
 
 # Add some sample data
 data = [
@@ -32,9 +32,8 @@ data = [
     ["Widget D", "West", 2000, 1800]
 ]
 
-for row_idx, row_data in enumerate(data, 1):
-    for col_idx, value in enumerate(row_data, 1):
-        ws1.cell(row=row_idx, column=col_idx, value=value)
+for row_data in data:
+    ws1.append(row_data)
 
 # Add named ranges
 
@@ -53,9 +52,8 @@ validation_data = [
     ["", "", "", ""]
 ]
 
-for row_idx, row_data in enumerate(validation_data, 1):
-    for col_idx, value in enumerate(row_data, 1):
-        ws2.cell(row=row_idx, column=col_idx, value=value)
+for row_data in validation_data:
+    ws2.append(row_data)
 
 # Add data validation rules
 # 1. Number validation (whole numbers between 1-100)
@@ -68,7 +66,7 @@ number_validation = DataValidation(
     errorTitle="Invalid Number",
     error="Please enter a number between 1 and 100"
 )
-ws2.add_data_validation(number_validation)
+ws2.data_validations.append(number_validation)
 number_validation.add("A2:A10")
 
 # 2. Date validation
@@ -80,7 +78,7 @@ date_validation = DataValidation(
     errorTitle="Invalid Date",
     error="Date must be after 2020-01-01"
 )
-ws2.add_data_validation(date_validation)
+ws2.data_validations.append(date_validation)
 date_validation.add("B2:B10")
 
 # 3. List validation
@@ -91,7 +89,7 @@ list_validation = DataValidation(
     errorTitle="Invalid Selection",
     error="Please select from the dropdown list"
 )
-ws2.add_data_validation(list_validation)
+ws2.data_validations.append(list_validation)
 list_validation.add("C2:C10")
 
 # 4. Text length validation
@@ -104,14 +102,13 @@ text_validation = DataValidation(
     errorTitle="Text Too Long",
     error="Text must be between 1 and 50 characters"
 )
-ws2.add_data_validation(text_validation)
+ws2.data_validations.append(text_validation)
 text_validation.add("D2:D10")
 
 # Sheet 3: More named ranges (sheet-specific)
 ws3 = wb.create_sheet("Summary")
-ws3["A1"] = "Summary Data"
-ws3["A2"] = "Total Sales"
-ws3["B2"] = "=SUM(SalesColumn)"
+ws3.append(["Summary Data"])
+ws3.append(["Total Sales", "=SUM(SalesColumn)"])
 
 # Add sheet-specific named range
 wb.defined_names["SummaryTitle"] = DefinedName("SummaryTitle", attr_text="Summary.A1", localSheetId=2)
@@ -3,6 +3,7 @@
 Step-by-step tutorial for using the tidyxl package
 """
 
+import numpy as np
 import pandas as pd
 
 from tidyxl import xlsx_cells, xlsx_formats
@@ -112,8 +113,10 @@ print("-" * 30)
 formula_cells = all_cells[all_cells['data_type'] == 'formula']
 if len(formula_cells) > 0:
     print(f"✓ Found {len(formula_cells)} formula cells:")
-    for _, cell in formula_cells.iterrows():
-        print(f"  {cell['address']}: {cell['content']}")
+    # zip over the column arrays: no per-row Series construction like iterrows
+    for address, content in zip(formula_cells['address'].to_numpy(),
+                                formula_cells['content'].to_numpy()):
+        print(f"  {address}: {content}")
 else:
     print("ℹ No formula cells found in this example")
 
@@ -124,8 +127,10 @@ print("-" * 45)
 # Find headers (typically row 1)
 headers = all_cells[(all_cells['row'] == 1) & (all_cells['data_type'] != 'blank')]
 print("Header cells (row 1):")
-for _, header in headers.iterrows():
-    print(f"  {header['sheet']}.{header['address']}: '{header['content']}'")
+for sheet, address, content in zip(headers['sheet'].to_numpy(),
+                                   headers['address'].to_numpy(),
+                                   headers['content'].to_numpy()):
+    print(f"  {sheet}.{address}: '{content}'")
 
 # Find numeric data
 numeric_data = all_cells[all_cells['data_type'] == 'numeric']
@@ -170,12 +175,16 @@ print(f"Text cells in Employees sheet: {len(employee_text)}")
 column_a_cells = all_cells[all_cells['col'] == 1]  # Column A
 print(f"Cells in column A across all sheets: {len(column_a_cells)}")
 
-# Find cells with specific content
-name_cells = all_cells[all_cells['content'].astype(str).str.contains('Alice', na=False)]
+# Find cells with specific content: a vectorized substring mask over the
+# column (regex=False for a literal scan, na=False to keep blanks out)
+name_mask = all_cells['content'].str.contains('Alice', na=False, regex=False)
+name_cells = all_cells[name_mask]
 if len(name_cells) > 0:
     print("Cells containing 'Alice':")
-    for _, cell in name_cells.iterrows():
-        print(f"  {cell['sheet']}.{cell['address']}: {cell['content']}")
+    for sheet, address, content in zip(name_cells['sheet'].to_numpy(),
+                                       name_cells['address'].to_numpy(),
+                                       name_cells['content'].to_numpy()):
+        print(f"  {sheet}.{address}: {content}")
 
 # STEP 10: Converting back to tabular format (bonus)
 print("\n\nSTEP 10: Converting back to tabular format (bonus)")
@@ -191,14 +200,19 @@ print("Reconstructed Employees table structure:")
 print("Original tidy format (first few rows):")
 print(emp_cells[['address', 'row', 'col', 'content']].head(8).to_string(index=False))
 
-# Create a pivot to reconstruct tabular format
+# Scatter contents straight into a grid to reconstruct tabular format:
+# every (row, col) pair is unique, so the pivot_table groupby machinery
+# (hash table plus aggregation) would be pure overhead
 if len(emp_cells) > 0:
-    pivot_table = emp_cells.pivot_table(
-        index='row',
-        columns='col',
-        values='content',
-        aggfunc='first'
-    ).fillna('')
+    rows = emp_cells['row'].to_numpy()
+    cols = emp_cells['col'].to_numpy()
+    grid = np.full((rows.max(), cols.max()), '', dtype=object)
+    grid[rows - 1, cols - 1] = emp_cells['content'].astype('object').fillna('').to_numpy()
+    pivot_table = pd.DataFrame(
+        grid,
+        index=pd.RangeIndex(1, rows.max() + 1, name='row'),
+        columns=pd.RangeIndex(1, cols.max() + 1, name='col')
+    )
     print(f"\nReconstructed as table ({pivot_table.shape[0]} rows x {pivot_table.shape[1]} cols):")
     print(pivot_table.to_string())
 
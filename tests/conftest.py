@@ -56,6 +56,26 @@ def sample_excel_file(temp_dir):
     return str(filepath)
 
 
+@pytest.fixture
+def sparse_excel_file(temp_dir):
+    """Create an Excel file with holes inside the used cell range"""
+    filepath = temp_dir / "sparse.xlsx"
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sparse"
+
+    # Scattered cells so the used range is mostly empty
+    ws["A1"] = "corner"
+    ws["C3"] = 42
+    ws["B5"] = 3.14
+
+    wb.save(filepath)
+    wb.close()
+
+    return str(filepath)
+
+
 @pytest.fixture
 def multi_sheet_excel_file(temp_dir):
     """Create an Excel file with multiple sheets"""
@@ -118,9 +138,10 @@ def excel_with_named_ranges(temp_dir):
         for col_idx, value in enumerate(row_data, 1):
             ws.cell(row=row_idx, column=col_idx, value=value)
 
-    # Add named ranges
+    # Add named ranges: two global, one scoped to the Data sheet
     wb.defined_names["DataRange"] = DefinedName("DataRange", attr_text="Data.A1:B4")
     wb.defined_names["ValueColumn"] = DefinedName("ValueColumn", attr_text="Data.B2:B4")
+    ws.defined_names["LocalRange"] = DefinedName("LocalRange", attr_text="Data!$B$2:$B$4")
 
     wb.save(filepath)
     wb.close()
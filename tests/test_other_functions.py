@@ -5,7 +5,8 @@ Tests for xlsx_sheet_names, xlsx_names, xlsx_validation, and xlsx_formats functi
 import pandas as pd
 import pytest
 
-from tidyxl import xlsx_formats, xlsx_names, xlsx_sheet_names, xlsx_validation
+from tidyxl import (xlsx_formats, xlsx_names, xlsx_names_many, xlsx_open,
+                    xlsx_sheet_names, xlsx_validation)
 
 
 class TestXlsxSheetNames:
@@ -102,6 +103,22 @@ class TestXlsxNames:
         with pytest.raises(ValueError):
             xlsx_names("test.txt", check_filetype=True)
 
+    def test_many_files(self, excel_with_named_ranges, empty_excel_file):
+        """Test batched extraction across several files"""
+        combined = xlsx_names_many([excel_with_named_ranges, empty_excel_file])
+
+        assert isinstance(combined, pd.DataFrame)
+        assert combined.index.names[0] == 'path'
+
+        # Each file's slice matches its standalone extraction (dtypes may
+        # widen when an empty frame joins the concat)
+        single = xlsx_names(excel_with_named_ranges)
+        extracted = combined.loc[excel_with_named_ranges].reset_index(drop=True)
+        pd.testing.assert_frame_equal(extracted, single, check_dtype=False)
+
+        # Empty input returns the empty schema
+        assert len(xlsx_names_many([])) == 0
+
 
 class TestXlsxValidation:
 
@@ -180,6 +197,52 @@ class TestXlsxValidation:
             xlsx_validation(excel_with_validation, sheets="NonExistentSheet")
 
 
+class TestXlsxOpen:
+
+    def test_all_views_from_one_parse(self, sample_excel_file):
+        """Test that xlsx_open exposes all extraction views"""
+        with xlsx_open(sample_excel_file) as book:
+            sheets = book.sheet_names
+            names = book.names
+            validation = book.validation()
+            formats = book.formats
+            cells = book.cells()
+
+        assert isinstance(sheets, list) and len(sheets) > 0
+        assert isinstance(names, pd.DataFrame)
+        assert isinstance(validation, pd.DataFrame)
+        assert isinstance(formats, dict)
+        assert isinstance(cells, pd.DataFrame) and len(cells) > 0
+
+    def test_matches_standalone_functions(self, multi_sheet_excel_file):
+        """Test that the fused views match the standalone functions"""
+        with xlsx_open(multi_sheet_excel_file) as book:
+            assert book.sheet_names == xlsx_sheet_names(multi_sheet_excel_file)
+            sheet_cells = book.cells(sheets="Employees")
+            assert all(sheet_cells['sheet'] == "Employees")
+
+    def test_names_include_sheet_scoped(self, excel_with_named_ranges):
+        """Test that book.names matches xlsx_names, local names included"""
+        with xlsx_open(excel_with_named_ranges) as book:
+            book_names = book.names
+        standalone = xlsx_names(excel_with_named_ranges)
+
+        pd.testing.assert_frame_equal(book_names, standalone)
+
+        # The fixture's sheet-scoped name must show up with its sheet
+        local = standalone[standalone['name'] == 'LocalRange']
+        assert len(local) == 1
+        assert local['sheet'].iloc[0] == 'Data'
+
+    def test_error_handling(self):
+        """Test error handling for xlsx_open"""
+        with pytest.raises((FileNotFoundError, ValueError)):
+            xlsx_open("non_existent_file.xlsx")
+
+        with pytest.raises(ValueError):
+            xlsx_open("test.txt", check_filetype=True)
+
+
 class TestXlsxFormats:
 
     def test_basic_functionality(self, sample_excel_file):
@@ -211,6 +274,19 @@ class TestXlsxFormats:
             for key in expected_font_keys:
                 assert key in font
 
+    def test_as_dataframes(self, sample_excel_file):
+        """Test the typed columnar return form"""
+        formats = xlsx_formats(sample_excel_file, as_dataframes=True)
+
+        expected_keys = ['fonts', 'fills', 'borders', 'number_formats']
+        for key in expected_keys:
+            assert key in formats
+            assert isinstance(formats[key], pd.DataFrame)
+
+        if len(formats['fonts']) > 0:
+            for col in ['name', 'size', 'bold', 'italic']:
+                assert col in formats['fonts'].columns
+
     def test_error_handling(self):
         """Test error handling for xlsx_formats"""
         with pytest.raises((FileNotFoundError, ValueError)):
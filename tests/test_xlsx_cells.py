@@ -5,7 +5,7 @@ Tests for xlsx_cells function
 import pandas as pd
 import pytest
 
-from tidyxl import xlsx_cells
+from tidyxl import xlsx_cells, xlsx_cells_fast
 
 
 class TestXlsxCells:
@@ -150,6 +150,58 @@ class TestXlsxCells:
         cells = xlsx_cells(sample_excel_file, check_filetype=False)
         assert len(cells) > 0
 
+    def test_usecols(self, sample_excel_file):
+        """Test column projection via usecols parameter"""
+        cells = xlsx_cells(sample_excel_file, usecols=['sheet', 'address', 'content'])
+
+        assert list(cells.columns) == ['sheet', 'address', 'content']
+        assert len(cells) > 0
+
+        # Unknown columns should raise
+        with pytest.raises(ValueError):
+            xlsx_cells(sample_excel_file, usecols=['not_a_column'])
+
+    def test_parallel(self, multi_sheet_excel_file):
+        """Test that parallel extraction matches the serial path"""
+        serial = xlsx_cells(multi_sheet_excel_file)
+        parallel = xlsx_cells(multi_sheet_excel_file, parallel=2)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_usecols_streaming_path(self, sample_excel_file, sparse_excel_file):
+        """Test that the read-only streaming loader matches the full loader"""
+        cols = ['sheet', 'address', 'row', 'col', 'content', 'data_type',
+                'numeric', 'character', 'formula']
+        slim = xlsx_cells(sample_excel_file, include_blank_cells=False, usecols=cols)
+        full = xlsx_cells(sample_excel_file, include_blank_cells=False)[cols]
+
+        pd.testing.assert_frame_equal(slim, full)
+
+        # The sparse file makes iter_rows pad the used range with
+        # EmptyCell placeholders, which the streaming loader must skip
+        slim = xlsx_cells(sparse_excel_file, include_blank_cells=False, usecols=cols)
+        full = xlsx_cells(sparse_excel_file, include_blank_cells=False)[cols]
+
+        pd.testing.assert_frame_equal(slim, full)
+        assert len(slim) == 3
+
+    def test_fast_entry_point(self, sample_excel_file):
+        """Test that xlsx_cells_fast matches xlsx_cells without blanks"""
+        fast = xlsx_cells_fast(sample_excel_file)
+        full = xlsx_cells(sample_excel_file, include_blank_cells=False)
+
+        pd.testing.assert_frame_equal(fast, full)
+        if len(fast) > 0:
+            assert not fast['is_blank'].any()
+
+    def test_repeated_reads_cached(self, sample_excel_file):
+        """Test that repeated reads return equal but independent frames"""
+        first = xlsx_cells(sample_excel_file)
+        second = xlsx_cells(sample_excel_file)
+
+        assert first is not second
+        pd.testing.assert_frame_equal(first, second)
+
     def test_empty_file(self, empty_excel_file):
         """Test handling of empty Excel files"""
         cells = xlsx_cells(empty_excel_file)
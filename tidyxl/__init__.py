@@ -6,10 +6,14 @@ into a tidy format where each row represents a single cell with all its
 properties including value, formatting, formulas, and comments.
 """
 
-from .cells import xlsx_cells
+from .book import XlsxBook, xlsx_open
+from .cells import xlsx_cells, xlsx_cells_fast
 from .formats import xlsx_formats
 from .validation import xlsx_validation
-from .workbook import xlsx_names, xlsx_sheet_names
+from .workbook import xlsx_names, xlsx_names_many, xlsx_sheet_names
 
 __version__ = "0.1.0"
-__all__ = ["xlsx_cells", "xlsx_formats", "xlsx_sheet_names", "xlsx_names", "xlsx_validation"]
+__all__ = [
+    "xlsx_cells", "xlsx_cells_fast", "xlsx_formats", "xlsx_sheet_names", "xlsx_names",
+    "xlsx_names_many", "xlsx_validation", "xlsx_open", "XlsxBook",
+]
@@ -0,0 +1,47 @@
+"""
+Shared file helpers: stamp keys for memoizing parse results and the
+common path check the public entry points perform
+"""
+
+import os
+from typing import Tuple
+
+# Bound on the per-function lru_cache sizes: parse results can be large,
+# so keep only a handful of recently used files
+CACHE_MAXSIZE = 8
+
+_XLSX_EXTENSIONS = ('.xlsx', '.xlsm')
+
+
+def check_file_type(path: str) -> None:
+    """
+    Raise ValueError unless the path carries an xlsx/xlsm extension.
+
+    Shared by every public entry point's check_filetype handling; only
+    the extension is lowercased, not the whole path.
+    """
+
+    if os.path.splitext(path)[1].lower() not in _XLSX_EXTENSIONS:
+        raise ValueError("File must be .xlsx or .xlsm format")
+
+
+def file_stamp(path: str) -> Tuple[str, int, int]:
+    """
+    Build a cache key that identifies a file's current contents.
+
+    The (path, mtime_ns, size) triple changes whenever the file is
+    edited, so cached parse results invalidate automatically.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file
+
+    Returns
+    -------
+    tuple
+        (path, st_mtime_ns, st_size)
+    """
+
+    stat = os.stat(path)
+    return (os.fspath(path), stat.st_mtime_ns, stat.st_size)
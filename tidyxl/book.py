@@ -0,0 +1,109 @@
+"""
+Single-pass workbook access for running several extractions on one file
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from ._cache import check_file_type
+from .cells import _cells_from_workbook
+from .formats import _formats_from_workbook
+from .validation import _validation_from_workbook
+from .workbook import _names_from_workbook
+
+
+class XlsxBook:
+    """
+    An xlsx (Excel) file opened once and shared by all tidyxl extractors.
+
+    Calling xlsx_cells, xlsx_names, xlsx_validation, xlsx_formats and
+    xlsx_sheet_names in sequence re-opens and re-parses the same file for
+    every call. XlsxBook loads the workbook a single time and exposes all
+    five views from that one parse.
+
+    Use as a context manager, or call close() when done:
+
+        with xlsx_open("file.xlsx") as book:
+            sheets = book.sheet_names
+            names = book.names
+            validation = book.validation()
+            formats = book.formats
+            cells = book.cells()
+    """
+
+    def __init__(self, path: str, check_filetype: bool = True):
+        # Check file type if requested
+        if check_filetype:
+            check_file_type(path)
+
+        self._wb = load_workbook(filename=path, data_only=False)
+        self._names: Optional[pd.DataFrame] = None
+        self._formats: Optional[Dict[str, Any]] = None
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Worksheet names in their original order."""
+        return self._wb.sheetnames
+
+    @property
+    def names(self) -> pd.DataFrame:
+        """Defined names, as returned by xlsx_names."""
+        if self._names is None:
+            self._names = _names_from_workbook(self._wb)
+        return self._names
+
+    @property
+    def formats(self) -> Dict[str, Any]:
+        """Formatting information, as returned by xlsx_formats."""
+        if self._formats is None:
+            self._formats = _formats_from_workbook(self._wb)
+        return self._formats
+
+    def cells(
+        self,
+        sheets: Optional[Union[str, List[str]]] = None,
+        include_blank_cells: bool = True,
+        usecols: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Tidy cell data, as returned by xlsx_cells."""
+        return _cells_from_workbook(self._wb, sheets, include_blank_cells, usecols)
+
+    def validation(
+        self,
+        sheets: Optional[Union[str, List[str]]] = None
+    ) -> pd.DataFrame:
+        """Data validation rules, as returned by xlsx_validation."""
+        return _validation_from_workbook(self._wb, sheets)
+
+    def close(self) -> None:
+        """Close the underlying workbook."""
+        self._wb.close()
+
+    def __enter__(self) -> "XlsxBook":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def xlsx_open(path: str, check_filetype: bool = True) -> XlsxBook:
+    """
+    Open an xlsx (Excel) file once for multiple tidyxl extractions.
+
+    Parameters
+    ----------
+    path : str
+        Path to the Excel file (.xlsx or .xlsm)
+    check_filetype : bool, default True
+        Whether to check that the file is a valid xlsx/xlsm file
+
+    Returns
+    -------
+    XlsxBook
+        A handle exposing sheet_names, names, formats, cells() and
+        validation() from a single workbook parse
+    """
+
+    return XlsxBook(path, check_filetype=check_filetype)
@@ -2,18 +2,56 @@
 Cell data extraction functionality
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter
+from openpyxl.cell.read_only import EMPTY_CELL
+from openpyxl.styles.numbers import BUILTIN_FORMATS
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.utils.datetime import from_excel
+from openpyxl.worksheet.dimensions import ColumnDimension
+
+from ._cache import CACHE_MAXSIZE, check_file_type, file_stamp
+
+# Column-letter lookup for every possible Excel column (A..XFD), so A1
+# addresses can be assembled for a whole frame with vectorized string
+# concatenation instead of one coordinate format call per cell
+_COL_LETTERS = np.array([get_column_letter(i) for i in range(1, 16385)], dtype='U3')
+
+# Date detection on number formats: one compiled character-class search
+# instead of eight substring scans, memoized per format string because
+# workbooks reuse a handful of formats across thousands of cells
+_DATE_FMT_RE = re.compile(r'[dmyhs:/\-]')
+_DATE_FMT_CACHE: Dict[str, bool] = {}
+
+# Cell data types in the (alphabetical) category order the frame exposes;
+# the scan records one small integer code per cell and the categorical
+# column is assembled from the codes in a single step
+_DATA_TYPES = ['blank', 'character', 'date', 'error', 'formula', 'logical', 'numeric']
+_DATA_TYPE_CODES = {name: code for code, name in enumerate(_DATA_TYPES)}
+
+# Canonical column order of the tidy cell schema (matching R tidyxl)
+_CELL_COLUMNS = [
+    'sheet', 'address', 'row', 'col', 'is_blank', 'content', 'data_type',
+    'error', 'logical', 'numeric', 'date', 'character', 'formula',
+    'is_array', 'formula_ref', 'formula_group', 'comment', 'height', 'width',
+    'row_outline_level', 'col_outline_level', 'style_format', 'local_format_id'
+]
 
 
 def xlsx_cells(
     path: str,
     sheets: Optional[Union[str, List[str]]] = None,
     check_filetype: bool = True,
-    include_blank_cells: bool = True
+    include_blank_cells: bool = True,
+    usecols: Optional[List[str]] = None,
+    parallel: Union[bool, int] = False
 ) -> pd.DataFrame:
     """
     Import xlsx (Excel) cell contents into a tidy structure.
@@ -32,6 +70,14 @@ def xlsx_cells(
         Whether to check that the file is a valid xlsx/xlsm file
     include_blank_cells : bool, default True
         Whether to include cells that have no value but may have formatting
+    usecols : list of str, or None
+        Column names to return. If None, returns all columns. Restricting
+        the columns also skips the per-cell work (comment, dimension and
+        formula probing) that only feeds the omitted columns.
+    parallel : bool or int, default False
+        If True (or a worker count), extract sheets in parallel worker
+        processes. Worthwhile for workbooks with several large sheets;
+        single-sheet reads fall back to the serial path.
 
     Returns
     -------
@@ -64,11 +110,139 @@ def xlsx_cells(
 
     # Check file type if requested
     if check_filetype:
-        if not path.lower().endswith(('.xlsx', '.xlsm')):
-            raise ValueError("File must be .xlsx or .xlsm format")
+        check_file_type(path)
 
-    # Load workbook
-    wb = load_workbook(filename=path, data_only=False, keep_vba=True)
+    # Cache key: file stamp plus the arguments that shape the output.
+    # The stamp includes mtime and size, so editing the file invalidates.
+    stamp = file_stamp(path)
+    sheets_key = (sheets,) if isinstance(sheets, str) else tuple(sheets) if sheets is not None else None
+    usecols_key = tuple(usecols) if usecols is not None else None
+
+    cached = _cells_cached(stamp, sheets_key, include_blank_cells, usecols_key, parallel)
+    # Hand out a copy so callers can mutate their frame without
+    # poisoning the cache
+    return cached.copy()
+
+
+def xlsx_cells_fast(
+    path: str,
+    sheets: Optional[Union[str, List[str]]] = None
+) -> pd.DataFrame:
+    """
+    Import non-blank xlsx cell contents with the pre-parse checks skipped.
+
+    A specialized entry point for bulk jobs: equivalent to calling
+    xlsx_cells with check_filetype=False and include_blank_cells=False.
+    Skipping blank cells also skips enumerating the sparse-grid holes of
+    each sheet's bounding box, so sparse sheets parse into much smaller
+    frames.
+
+    Parameters
+    ----------
+    path : str
+        Path to the Excel file (.xlsx or .xlsm)
+    sheets : str, list of str, or None
+        Worksheet names to read. If None, reads all sheets.
+
+    Returns
+    -------
+    pd.DataFrame
+        The same tidy cell structure as xlsx_cells, without blank cells.
+    """
+
+    return xlsx_cells(path, sheets=sheets, check_filetype=False,
+                      include_blank_cells=False)
+
+
+@lru_cache(maxsize=CACHE_MAXSIZE)
+def _cells_cached(stamp, sheets_key, include_blank_cells, usecols_key, parallel) -> pd.DataFrame:
+    """Parse and cache one (file stamp, arguments) combination."""
+
+    path = stamp[0]
+    sheets = list(sheets_key) if sheets_key is not None else None
+    usecols = list(usecols_key) if usecols_key is not None else None
+
+    if parallel:
+        result = _cells_parallel(path, sheets, include_blank_cells, usecols, parallel)
+        if result is not None:
+            return result
+        # Fewer than two sheets selected: fall through to the serial path
+
+    if _can_stream(include_blank_cells, usecols):
+        # openpyxl's read-only mode streams rows straight off the sheet
+        # XML without building the full workbook object graph, cutting
+        # per-cell allocations and peak memory on large files. External
+        # link records are skipped too — nothing here follows them.
+        wb = load_workbook(filename=path, read_only=True, data_only=False,
+                           keep_links=False)
+        try:
+            return _cells_from_workbook(wb, sheets, include_blank_cells, usecols)
+        finally:
+            wb.close()
+
+    # Load the full workbook: comments, dimensions and styles are only
+    # available from the complete object graph. The VBA archive is never
+    # read (nothing here saves the workbook), so it is not retained.
+    wb = load_workbook(filename=path, data_only=False)
+
+    return _cells_from_workbook(wb, sheets, include_blank_cells, usecols)
+
+
+def _can_stream(include_blank_cells: bool, usecols: Optional[List[str]]) -> bool:
+    """
+    Decide whether the read-only streaming loader can serve a request.
+
+    Streaming rows can't represent blank grid holes (they carry no
+    coordinates) and never parses comments, row/column dimensions or
+    named styles, so those requests need the full workbook graph.
+    """
+
+    if include_blank_cells or usecols is None:
+        return False
+
+    wanted = set(usecols)
+    return not (wanted & {'comment', 'height', 'width',
+                          'row_outline_level', 'col_outline_level',
+                          'style_format'})
+
+
+def _cells_from_workbook(
+    wb,
+    sheets: Optional[Union[str, List[str]]] = None,
+    include_blank_cells: bool = True,
+    usecols: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Extract tidy cell data from an already-loaded openpyxl workbook.
+
+    This is the shared implementation behind xlsx_cells and XlsxBook.cells,
+    so a workbook parsed once can serve several extractions.
+    """
+
+    # Validate the requested column projection
+    if usecols is not None:
+        unknown = [col for col in usecols if col not in _CELL_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown columns: {unknown}. Valid columns: {_CELL_COLUMNS}")
+    wanted = set(usecols) if usecols is not None else set(_CELL_COLUMNS)
+
+    # Per-cell probes that are only needed for certain columns
+    need_comment = 'comment' in wanted
+    need_dimensions = bool(wanted & {'height', 'width', 'row_outline_level', 'col_outline_level'})
+    need_formula = bool(wanted & {'formula', 'is_array', 'formula_ref', 'formula_group'})
+    need_style = bool(wanted & {'style_format', 'local_format_id'})
+
+    # The workbook's cellXfs table: a cell's position in it is its local
+    # format id, reproducible across runs and processes for a given file
+    # (the IndexedList resolves index() through a hash map, so the lookup
+    # is O(1) per cell)
+    cell_styles = wb._cell_styles
+
+    # Resolve each cellXfs entry's number format to a date-or-not flag
+    # once per workbook: the hot loop then indexes this list instead of
+    # resolving cell.number_format (a builtin-table or custom-format
+    # lookup) and scanning the format string per numeric cell
+    date_flags = _date_xf_flags(wb)
 
     # Determine which sheets to process
     if sheets is None:
@@ -84,209 +258,454 @@ def xlsx_cells(
         if sheet_name not in available_sheets:
             raise ValueError(f"Sheet '{sheet_name}' not found. Available sheets: {available_sheets}")
 
-    all_cells = []
+    # Accumulate column-by-column (structure-of-arrays) rather than one
+    # dict per cell: the per-row dict allocations go away and pandas can
+    # build each column directly from a homogeneous list instead of
+    # re-assembling rows
+    data: Dict[str, List[Any]] = {name: [] for name in _CELL_COLUMNS}
 
-    for sheet_name in sheet_names:
-        ws = wb[sheet_name]
+    # Emit sheets in sorted-name order so the output's sheet grouping is
+    # already in place and only (row, col) within each sheet's span needs
+    # ordering afterwards — no full-frame multi-key sort
+    sheet_spans = []
 
-        # Get all cells in the worksheet
-        for row in ws.iter_rows():
-            for cell in row:
-                # Determine if cell is blank
-                is_blank = cell.value is None and (cell.data_type == 'n' or cell.data_type is None)
-
-                # Skip blank cells if not requested
-                if not include_blank_cells and is_blank:
-                    continue
-
-                # Get raw content as string
-                content = str(cell.value) if cell.value is not None else None
-
-                # Determine data type and extract typed values
-                data_type, typed_values = _get_cell_data_and_values(cell)
-
-                # Get formula information
-                formula_info = _get_formula_info(cell)
-
-                # Get comment
-                comment = cell.comment.text if cell.comment else None
-
-                # Get dimensions
-                row_height = ws.row_dimensions[cell.row].height
-                col_width = ws.column_dimensions[get_column_letter(cell.column)].width
-
-                # Get outline levels
-                row_outline_level = ws.row_dimensions[cell.row].outline_level or 0
-                col_outline_level = ws.column_dimensions[get_column_letter(cell.column)].outline_level or 0
-
-                # Create cell record matching R tidyxl structure
-                cell_record = {
-                    'sheet': sheet_name,
-                    'address': cell.coordinate,
-                    'row': cell.row,
-                    'col': cell.column,
-                    'is_blank': is_blank,
-                    'content': content,
-                    'data_type': data_type,
-                    'error': typed_values.get('error'),
-                    'logical': typed_values.get('logical'),
-                    'numeric': typed_values.get('numeric'),
-                    'date': typed_values.get('date'),
-                    'character': typed_values.get('character'),
-                    'formula': formula_info['formula'],
-                    'is_array': formula_info['is_array'],
-                    'formula_ref': formula_info['formula_ref'],
-                    'formula_group': formula_info['formula_group'],
-                    'comment': comment,
-                    'height': row_height,
-                    'width': col_width,
-                    'row_outline_level': row_outline_level,
-                    'col_outline_level': col_outline_level,
-                    'style_format': cell.style if hasattr(cell, 'style') else None,
-                    'local_format_id': id(cell.number_format) if cell.number_format else None
-                }
-
-                all_cells.append(cell_record)
+    for sheet_name in sorted(sheet_names):
+        ws = wb[sheet_name]
+        span_start = len(data['sheet'])
+
+        if need_dimensions:
+            # Snapshot the sheet's explicit row/column dimensions once:
+            # the per-cell ws.row_dimensions[...] lookups would otherwise
+            # hit (and lazily grow) openpyxl's dimension holders four
+            # times per cell
+            row_dims = {r: (dim.height, dim.outline_level or 0)
+                        for r, dim in ws.row_dimensions.items()}
+            col_dims = {column_index_from_string(letter): (dim.width, dim.outline_level or 0)
+                        for letter, dim in ws.column_dimensions.items()}
+            # Rows and columns without an explicit entry report openpyxl's
+            # defaults (no height, default column width)
+            default_col = ColumnDimension(ws)
+            no_row_dim = (None, 0)
+            no_col_dim = (default_col.width, default_col.outline_level or 0)
+            dims = (row_dims, col_dims, no_row_dim, no_col_dim)
+        else:
+            dims = None
+
+        has_store = hasattr(ws, '_cells')
+        if has_store:
+            # Only the cells actually present in the sheet XML: the
+            # sparse-grid holes are synthesized in bulk below rather than
+            # materialized by iter_rows as one empty Cell object apiece
+            cell_iter = ws._cells.values()
+        else:
+            # Read-only worksheets have no cell store, so they always
+            # stream through iter_rows. Holes inside the used range come
+            # back as the EMPTY_CELL singleton, which has none of the
+            # real cell slots — filter it here; streaming only runs when
+            # blanks are excluded anyway.
+            cell_iter = (cell for row in ws.iter_rows() for cell in row
+                         if cell is not EMPTY_CELL)
+
+        for cell in cell_iter:
+            # Read the raw value slot: the value property is a plain
+            # passthrough on both cell flavors, so this skips one
+            # descriptor dispatch per cell
+            value = cell._value
+            cell_type = cell.data_type
+
+            # Determine if cell is blank
+            is_blank = value is None and (cell_type == 'n' or cell_type is None)
+
+            # Skip blank cells if not requested
+            if not include_blank_cells and is_blank:
+                continue
+
+            # Cell's index into the cellXfs table: drives both the date
+            # check and local_format_id. Read-only cells carry the index
+            # directly; full cells carry the style array, which the
+            # table maps back in O(1).
+            if has_store:
+                style = cell._style
+                xf_index = cell_styles.index(style) if style is not None else 0
+            else:
+                xf_index = cell._style_id
+
+            # Get raw content as string; already-string values (the bulk
+            # of text-heavy sheets) pass through without a str() copy
+            if value is None:
+                content = None
+            elif isinstance(value, str):
+                content = value
+            else:
+                content = str(value)
+
+            # Determine data type and extract the one typed value inline:
+            # a helper returning a five-slot dict per cell would allocate
+            # two throwaway containers on every iteration
+            error_val = logical_val = numeric_val = date_val = character_val = None
+            if value is None:
+                data_type = 'blank'
+            elif cell_type == 'n':  # Numeric — by far the most common tag,
+                # so it is tested first and pays for no other probes
+                if date_flags[xf_index]:
+                    try:
+                        # Convert Excel date serial to datetime
+                        date_val = from_excel(value)
+                        data_type = 'date'
+                    except Exception:
+                        # Fall back to numeric if date conversion fails
+                        numeric_val = float(value)
+                        data_type = 'numeric'
+                else:
+                    numeric_val = float(value)
+                    data_type = 'numeric'
+            elif cell_type == 'e':  # Error
+                error_val = str(value)
+                data_type = 'error'
+            elif cell_type == 'b':  # Boolean
+                logical_val = bool(value)
+                data_type = 'logical'
+            elif cell_type == 'f':  # Formula
+                data_type = 'formula'
+            else:  # String types ('s', 'inlineStr', 'str')
+                character_val = value if isinstance(value, str) else str(value)
+                data_type = 'character'
+
+            # Get formula information, likewise without a per-cell dict.
+            # Array and shared formula metadata is not exposed on the
+            # cell object by openpyxl (it arrives as the cell value), so
+            # no per-cell attribute probing happens here.
+            formula = formula_ref = formula_group = None
+            is_array = False
+            if need_formula and cell_type == 'f' and value:
+                formula = str(value)
+
+            # Get comment straight off the cell's slot, skipping the
+            # property descriptor call. need_comment is only True on the
+            # full-graph path, whose cells all carry the slot.
+            comment = cell._comment.text if need_comment and cell._comment is not None else None
+
+            # Get dimensions and outline levels from the snapshots
+            if dims is not None:
+                row_height, row_outline_level = row_dims.get(cell.row, no_row_dim)
+                col_width, col_outline_level = col_dims.get(cell.column, no_col_dim)
+            else:
+                row_height = col_width = None
+                row_outline_level = col_outline_level = 0
+
+            # Append one value per column, matching R tidyxl structure
+            data['sheet'].append(sheet_name)
+            data['row'].append(cell.row)
+            data['col'].append(cell.column)
+            data['is_blank'].append(is_blank)
+            data['content'].append(content)
+            data['data_type'].append(_DATA_TYPE_CODES[data_type])
+            data['error'].append(error_val)
+            data['logical'].append(logical_val)
+            data['numeric'].append(numeric_val)
+            data['date'].append(date_val)
+            data['character'].append(character_val)
+            data['formula'].append(formula)
+            data['is_array'].append(is_array)
+            data['formula_ref'].append(formula_ref)
+            data['formula_group'].append(formula_group)
+            data['comment'].append(comment)
+            data['height'].append(row_height)
+            data['width'].append(col_width)
+            data['row_outline_level'].append(row_outline_level)
+            data['col_outline_level'].append(col_outline_level)
+            # Named style only exists on full cells; whether the sheet
+            # yields full or read-only cells is fixed per sheet, so the
+            # per-cell hasattr probe reduces to the has_store flag
+            data['style_format'].append(cell.style if need_style and has_store else None)
+            data['local_format_id'].append(xf_index if need_style else None)
+
+        if include_blank_cells and has_store:
+            _append_blank_cells(data, ws, sheet_name, dims, need_style)
+
+        sheet_spans.append((span_start, len(data['sheet'])))
 
     # Convert to DataFrame with proper columns even if empty
-    if not all_cells:
+    if not data['sheet']:
         # Return empty DataFrame with correct column structure
-        expected_columns = [
-            'sheet', 'address', 'row', 'col', 'is_blank', 'content', 'data_type',
-            'error', 'logical', 'numeric', 'date', 'character', 'formula',
-            'is_array', 'formula_ref', 'formula_group', 'comment', 'height', 'width',
-            'row_outline_level', 'col_outline_level', 'style_format', 'local_format_id'
-        ]
-        return pd.DataFrame(columns=expected_columns)
-
-    df = pd.DataFrame(all_cells)
+        return pd.DataFrame(columns=[col for col in _CELL_COLUMNS if col in wanted])
+
+    # Assemble every A1 address in one vectorized concatenation of the
+    # precomputed column letters with the row numbers
+    row_arr = np.array(data['row'], dtype=np.int32)
+    col_arr = np.array(data['col'], dtype=np.intp)
+    data['address'] = np.char.add(_COL_LETTERS[col_arr - 1], row_arr.astype('U7'))
+
+    # Hand the dense numeric columns to pandas as ready-made narrow arrays
+    # (sized to Excel's own limits: 1,048,576 rows, 16,384 columns,
+    # outline levels 0-7) — building them from the Python lists would go
+    # through an int64 object-inference pass first and then downcast
+    data['row'] = row_arr
+    data['col'] = col_arr.astype(np.int16)
+    data['row_outline_level'] = np.array(data['row_outline_level'], dtype=np.int8)
+    data['col_outline_level'] = np.array(data['col_outline_level'], dtype=np.int8)
+    data['is_blank'] = np.array(data['is_blank'], dtype=np.bool_)
+    data['is_array'] = np.array(data['is_array'], dtype=np.bool_)
+
+    # Build the data_type categorical straight from the recorded codes —
+    # no per-string factorization pass. Unused categories are dropped so
+    # the observed category set matches what the sheet contains.
+    data['data_type'] = pd.Categorical.from_codes(
+        np.array(data['data_type'], dtype=np.int8), categories=_DATA_TYPES
+    ).remove_unused_categories()
+
+    df = pd.DataFrame(data)
+
+    # Low-cardinality string columns become categoricals: equality filters
+    # and value_counts then work on integer codes instead of per-row
+    # Python string comparisons
+    df['sheet'] = df['sheet'].astype('category')
+
+    # Raw content and formulas repeat heavily in real spreadsheets (the
+    # same labels, categories and copied-down formulas), so dictionary-
+    # encode them too: each distinct string is stored once and rows hold
+    # integer codes
+    df['content'] = df['content'].astype('category')
+    df['formula'] = df['formula'].astype('category')
+
+    # Mostly-string columns get the string dtype explicitly instead of
+    # object arrays of str-or-None (all-null columns would otherwise stay
+    # object). 'string' has kept missing values as NA since pandas 1.0 —
+    # unlike 'str', which object-casts None to the literal 'None' before
+    # pandas 3 — and is backed by Arrow buffers when pyarrow is
+    # installed, so substring scans skip per-row Python dispatch
+    for name in ('character', 'comment', 'error', 'formula_ref', 'style_format'):
+        df[name] = df[name].astype('string')
+
+    # Typed value columns use masked/native dtypes instead of object arrays
+    # of Python scalars, so reductions like min/max/mean run as NumPy
+    # kernels over contiguous buffers
+    df['logical'] = df['logical'].astype('boolean')
+    df['numeric'] = df['numeric'].astype('Float64')
+    df['date'] = pd.to_datetime(df['date'])
+
+    # Remaining sparse numeric columns get masked dtypes as well: height
+    # and width are null for most cells, and formula_group ids exceed
+    # 32 bits, so Int64 is the narrowest safe width
+    df['height'] = df['height'].astype('Float64')
+    df['width'] = df['width'].astype('Float64')
+    df['formula_group'] = df['formula_group'].astype('Int64')
+    df['local_format_id'] = df['local_format_id'].astype('Int32')
+
+    # Order by (row, col) within each sheet's contiguous span. Sheets
+    # were emitted in sorted-name order, so stitching the per-span
+    # permutations together replaces a full-frame three-key sort_values.
+    # Sheet XML nearly always stores cells in row-major order already, so
+    # each span gets a cheap monotonicity check on a combined
+    # (row << 15 | col) key first and is sorted only if it fails — the
+    # check is a single vectorized comparison, the sort it avoids is
+    # O(n log n) plus a full-frame take
+    must_sort = False
+    order_parts = []
+    for start, end in sheet_spans:
+        if end <= start:
+            continue
+        span_keys = (row_arr[start:end].astype(np.int64) << 15) | col_arr[start:end]
+        if span_keys.size > 1 and np.any(span_keys[1:] <= span_keys[:-1]):
+            order_parts.append(start + np.argsort(span_keys, kind='stable'))
+            must_sort = True
+        else:
+            order_parts.append(np.arange(start, end))
+    if must_sort:
+        df = df.take(np.concatenate(order_parts)).reset_index(drop=True)
 
-    # Sort by sheet, row, column for consistent output
-    df = df.sort_values(['sheet', 'row', 'col']).reset_index(drop=True)
+    # Apply the column projection, keeping canonical column order
+    if usecols is not None:
+        df = df[[col for col in _CELL_COLUMNS if col in wanted]]
 
     return df
 
 
-def _get_cell_data_and_values(cell) -> Tuple[str, Dict[str, Any]]:
+def _append_blank_cells(
+    data: Dict[str, List[Any]],
+    ws,
+    sheet_name: str,
+    dims: Optional[tuple],
+    need_style: bool
+) -> None:
     """
-    Determine the data type of a cell and extract typed values.
+    Synthesize the blank grid holes of one sheet in bulk.
 
-    Parameters
-    ----------
-    cell : openpyxl.cell.Cell
-        The cell to analyze
+    Cells absent from the sheet XML carry no value, comment or local
+    formatting, so their rows can be generated from the bounding box
+    with array ops instead of asking openpyxl to materialize an empty
+    Cell object per hole.
+    """
 
-    Returns
-    -------
-    tuple
-        (data_type, typed_values_dict) where data_type is one of:
-        'error', 'logical', 'numeric', 'date', 'character', 'blank'
-        and typed_values_dict contains the appropriate typed value
+    n_rows = ws.max_row
+    n_cols = ws.max_column
+
+    holes = np.ones((n_rows, n_cols), dtype=bool)
+    if ws._cells:
+        present = np.array(list(ws._cells), dtype=np.intp)
+        holes[present[:, 0] - 1, present[:, 1] - 1] = False
+
+    hole_rows, hole_cols = np.nonzero(holes)
+    if hole_rows.size == 0:
+        return
+    hole_rows += 1
+    hole_cols += 1
+    n = hole_rows.size
+
+    data['sheet'].extend([sheet_name] * n)
+    data['row'].extend(hole_rows.tolist())
+    data['col'].extend(hole_cols.tolist())
+    data['is_blank'].extend([True] * n)
+    data['data_type'].extend([_DATA_TYPE_CODES['blank']] * n)
+    data['is_array'].extend([False] * n)
+    for name in ('content', 'error', 'logical', 'numeric', 'date', 'character',
+                 'formula', 'formula_ref', 'formula_group', 'comment'):
+        data[name].extend([None] * n)
+
+    if dims is not None:
+        row_dims, col_dims, no_row_dim, no_col_dim = dims
+        hole_row_list = hole_rows.tolist()
+        hole_col_list = hole_cols.tolist()
+        data['height'].extend(row_dims.get(r, no_row_dim)[0] for r in hole_row_list)
+        data['width'].extend(col_dims.get(c, no_col_dim)[0] for c in hole_col_list)
+        data['row_outline_level'].extend(row_dims.get(r, no_row_dim)[1] for r in hole_row_list)
+        data['col_outline_level'].extend(col_dims.get(c, no_col_dim)[1] for c in hole_col_list)
+    else:
+        data['height'].extend([None] * n)
+        data['width'].extend([None] * n)
+        data['row_outline_level'].extend([0] * n)
+        data['col_outline_level'].extend([0] * n)
+
+    # Holes have no local formatting: the default named style and the
+    # first cellXfs entry, matching what openpyxl reports for an
+    # untouched cell
+    data['style_format'].extend(['Normal' if need_style else None] * n)
+    data['local_format_id'].extend([0 if need_style else None] * n)
+
+
+def _read_sheet_cells(args) -> pd.DataFrame:
     """
+    Worker entry point for parallel extraction: read one sheet of one file.
 
-    typed_values: Dict[str, Any] = {
-        'error': None,
-        'logical': None,
-        'numeric': None,
-        'date': None,
-        'character': None
-    }
-
-    if cell.value is None:
-        return 'blank', typed_values
-
-    # Handle different openpyxl data types
-    if cell.data_type == 'e':  # Error
-        typed_values['error'] = str(cell.value)
-        return 'error', typed_values
-
-    elif cell.data_type == 'b':  # Boolean
-        typed_values['logical'] = bool(cell.value)
-        return 'logical', typed_values
-
-    elif cell.data_type == 'n':  # Numeric
-        # Check if it's a date by looking at number format
-        if _is_date_format(cell):
-            try:
-                # Convert Excel date serial to datetime
-                from openpyxl.utils.datetime import from_excel
-                typed_values['date'] = from_excel(cell.value)
-                return 'date', typed_values
-            except Exception:
-                # Fall back to numeric if date conversion fails
-                typed_values['numeric'] = float(cell.value)
-                return 'numeric', typed_values
-        else:
-            typed_values['numeric'] = float(cell.value)
-            return 'numeric', typed_values
+    Takes a single args tuple so it can be dispatched via executor.map.
+    """
 
-    elif cell.data_type == 'f':  # Formula
-        # For formulas, return 'formula' as data_type and don't populate character column
-        # The formula itself will be handled by _get_formula_info
-        return 'formula', typed_values
+    path, sheet_name, include_blank_cells, usecols = args
+    wb = load_workbook(filename=path, data_only=False)
+    return _cells_from_workbook(wb, [sheet_name], include_blank_cells, usecols)
 
-    else:  # String types ('s', 'inlineStr', 'str')
-        typed_values['character'] = str(cell.value)
-        return 'character', typed_values
 
+def _cells_parallel(
+    path: str,
+    sheets: Optional[Union[str, List[str]]],
+    include_blank_cells: bool,
+    usecols: Optional[List[str]],
+    parallel: Union[bool, int]
+) -> Optional[pd.DataFrame]:
+    """
+    Extract sheets in parallel worker processes.
 
-def _is_date_format(cell) -> bool:
+    Returns None when fewer than two sheets are selected, in which case
+    the serial path is cheaper than paying pool startup.
     """
-    Check if a cell's number format indicates it's a date.
 
-    Parameters
-    ----------
-    cell : openpyxl.cell.Cell
-        The cell to check
+    # Resolve and validate sheet names with a cheap read-only peek
+    wb = load_workbook(filename=path, read_only=True, keep_links=False)
+    try:
+        available_sheets = wb.sheetnames
+    finally:
+        wb.close()
 
-    Returns
-    -------
-    bool
-        True if the cell appears to be formatted as a date
+    if sheets is None:
+        sheet_names = available_sheets
+    elif isinstance(sheets, str):
+        sheet_names = [sheets]
+    else:
+        sheet_names = sheets
+
+    for sheet_name in sheet_names:
+        if sheet_name not in available_sheets:
+            raise ValueError(f"Sheet '{sheet_name}' not found. Available sheets: {available_sheets}")
+
+    if len(sheet_names) < 2:
+        return None
+
+    # One worker per sheet, capped at the CPU count — more workers than
+    # sheets would just sit idle holding pool resources. An explicit
+    # worker count gets the sheet cap too, for the same reason.
+    if parallel is True:
+        max_workers = min(len(sheet_names), os.cpu_count() or 1)
+    else:
+        max_workers = min(int(parallel), len(sheet_names))
+
+    # Sorted sheet order matches the serial output's sort
+    tasks = [(path, name, include_blank_cells, usecols) for name in sorted(sheet_names)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(_read_sheet_cells, tasks))
+
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=[col for col in _CELL_COLUMNS
+                                     if usecols is None or col in usecols])
+
+    # Re-run dtype inference: concatenating frames where a string column
+    # is all-None in some sheets falls back to object
+    df = pd.concat(frames, ignore_index=True).infer_objects()
+
+    # Re-establish the categorical dtypes: concatenating per-sheet frames
+    # with differing category sets falls back to object
+    for col in ('sheet', 'data_type', 'content', 'formula'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    return df
+
+
+def _date_xf_flags(wb) -> List[bool]:
     """
+    Map every cellXfs entry of a workbook to a date-format flag.
 
-    if not cell.number_format:
-        return False
+    Resolves each entry's numFmtId to its format string (builtin table
+    for ids below 164, the workbook's custom formats above) and applies
+    the date check once, so the per-cell hot path reduces to one list
+    index.
+    """
+
+    custom_formats = wb._number_formats
 
-    # Common date format indicators
-    date_indicators = ['d', 'm', 'y', 'h', 's', ':', '/', '-']
-    format_str = cell.number_format.lower()
+    flags = []
+    for style in wb._cell_styles:
+        nf_id = style.numFmtId
+        if nf_id < 164:
+            number_format = BUILTIN_FORMATS.get(nf_id, 'General')
+        else:
+            number_format = custom_formats[nf_id - 164]
+        flags.append(_is_date_format(number_format))
 
-    # Check if format contains date indicators
-    return any(indicator in format_str for indicator in date_indicators)
+    return flags
 
 
-def _get_formula_info(cell) -> Dict[str, Any]:
+def _is_date_format(number_format: str) -> bool:
     """
-    Extract formula-related information from a cell.
+    Check if a number format string indicates a date.
 
     Parameters
     ----------
-    cell : openpyxl.cell.Cell
-        The cell to analyze
+    number_format : str
+        The number format code to check
 
     Returns
     -------
-    dict
-        Dictionary with formula, is_array, formula_ref, formula_group
+    bool
+        True if the format appears to be a date format
     """
 
-    formula_info: Dict[str, Any] = {
-        'formula': None,
-        'is_array': False,
-        'formula_ref': None,
-        'formula_group': None
-    }
-
-    if cell.data_type == 'f' and cell.value:
-        formula_info['formula'] = str(cell.value)
-
-        # Check for array formula indicators
-        if hasattr(cell, 'array_formula') and cell.array_formula:
-            formula_info['is_array'] = True
-
-        # Try to get formula reference range (this is limited in openpyxl)
-        if hasattr(cell, 'shared_formula'):
-            formula_info['formula_group'] = id(cell.shared_formula)
+    if not number_format:
+        return False
 
-    return formula_info
+    # Check if the format contains date indicators, consulting the
+    # per-format-string cache first
+    hit = _DATE_FMT_CACHE.get(number_format)
+    if hit is None:
+        hit = _DATE_FMT_CACHE[number_format] = bool(_DATE_FMT_RE.search(number_format.lower()))
+    return hit
@@ -2,12 +2,17 @@
 Formatting information extraction functionality
 """
 
+import copy
+from functools import lru_cache
 from typing import Any, Dict
 
+import pandas as pd
 from openpyxl import load_workbook
 
+from ._cache import CACHE_MAXSIZE, file_stamp
 
-def xlsx_formats(path: str) -> Dict[str, Any]:
+
+def xlsx_formats(path: str, as_dataframes: bool = False) -> Dict[str, Any]:
     """
     Import xlsx (Excel) formatting information.
 
@@ -18,6 +23,11 @@ def xlsx_formats(path: str) -> Dict[str, Any]:
     ----------
     path : str
         Path to the Excel file (.xlsx or .xlsm)
+    as_dataframes : bool, default False
+        If True, return each category as a typed columnar DataFrame
+        instead of a list of per-entry dicts. The columnar form stores
+        each attribute once per column rather than one dict per entry,
+        and boolean/numeric attributes get proper dtypes.
 
     Returns
     -------
@@ -29,7 +39,34 @@ def xlsx_formats(path: str) -> Dict[str, Any]:
         - number_formats: number format details
     """
 
-    wb = load_workbook(filename=path, data_only=False)
+    # Deep copy on cache hit: the entries are nested dicts, so a shallow
+    # copy would let callers mutate the cached values
+    formats = copy.deepcopy(_formats_cached(file_stamp(path)))
+
+    if as_dataframes:
+        return {
+            category: pd.DataFrame(entries).convert_dtypes()
+            for category, entries in formats.items()
+        }
+
+    return formats
+
+
+@lru_cache(maxsize=CACHE_MAXSIZE)
+def _formats_cached(stamp) -> Dict[str, Any]:
+    """Parse and cache the formatting information of one file stamp."""
+
+    wb = load_workbook(filename=stamp[0], data_only=False)
+
+    return _formats_from_workbook(wb)
+
+
+def _formats_from_workbook(wb) -> Dict[str, Any]:
+    """
+    Extract formatting information from an already-loaded openpyxl workbook.
+
+    Shared implementation behind xlsx_formats and XlsxBook.formats.
+    """
 
     formats: dict = {
         'fonts': [],
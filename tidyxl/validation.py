@@ -2,11 +2,20 @@
 Data validation extraction functionality
 """
 
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 from openpyxl import load_workbook
 
+from ._cache import check_file_type
+
+# Canonical column order of the validation schema
+_VALIDATION_COLUMNS = [
+    'sheet', 'ref', 'type', 'operator', 'formula1', 'formula2',
+    'allow_blank', 'show_input_message', 'show_error_message',
+    'prompt_title', 'prompt', 'error_title', 'error', 'error_style'
+]
+
 
 def xlsx_validation(
     path: str,
@@ -50,12 +59,25 @@ def xlsx_validation(
 
     # Check file type if requested
     if check_filetype:
-        if not path.lower().endswith(('.xlsx', '.xlsm')):
-            raise ValueError("File must be .xlsx or .xlsm format")
+        check_file_type(path)
 
     # Load workbook
     wb = load_workbook(filename=path, data_only=False)
 
+    return _validation_from_workbook(wb, sheets, close_workbook=True)
+
+
+def _validation_from_workbook(
+    wb,
+    sheets: Optional[Union[str, List[str]]] = None,
+    close_workbook: bool = False
+) -> pd.DataFrame:
+    """
+    Extract validation rules from an already-loaded openpyxl workbook.
+
+    Shared implementation behind xlsx_validation and XlsxBook.validation.
+    """
+
     # Determine which sheets to process
     if sheets is None:
         sheet_names = wb.sheetnames
@@ -70,7 +92,10 @@ def xlsx_validation(
         if sheet_name not in available_sheets:
             raise ValueError(f"Sheet '{sheet_name}' not found. Available sheets: {available_sheets}")
 
-    validation_list = []
+    # Accumulate column-by-column, matching the cell extractor: pandas
+    # builds each column from one homogeneous list instead of re-keying
+    # a fourteen-slot dict per rule
+    data: Dict[str, List[Any]] = {name: [] for name in _VALIDATION_COLUMNS}
 
     try:
         for sheet_name in sheet_names:
@@ -79,41 +104,39 @@ def xlsx_validation(
             # Get data validation rules
             if hasattr(ws, 'data_validations'):
                 for dv in ws.data_validations.dataValidation:
-                    validation_record = {
-                        'sheet': sheet_name,
-                        'ref': str(dv.sqref) if dv.sqref else None,
-                        'type': dv.type,
-                        'operator': dv.operator,
-                        'formula1': dv.formula1,
-                        'formula2': dv.formula2,
-                        'allow_blank': dv.allowBlank,
-                        'show_input_message': dv.showInputMessage,
-                        'show_error_message': dv.showErrorMessage,
-                        'prompt_title': dv.promptTitle,
-                        'prompt': dv.prompt,
-                        'error_title': dv.errorTitle,
-                        'error': dv.error,
-                        'error_style': dv.errorStyle
-                    }
-
-                    validation_list.append(validation_record)
+                    data['sheet'].append(sheet_name)
+                    data['ref'].append(str(dv.sqref) if dv.sqref else None)
+                    data['type'].append(dv.type)
+                    data['operator'].append(dv.operator)
+                    data['formula1'].append(dv.formula1)
+                    data['formula2'].append(dv.formula2)
+                    data['allow_blank'].append(dv.allowBlank)
+                    data['show_input_message'].append(dv.showInputMessage)
+                    data['show_error_message'].append(dv.showErrorMessage)
+                    data['prompt_title'].append(dv.promptTitle)
+                    data['prompt'].append(dv.prompt)
+                    data['error_title'].append(dv.errorTitle)
+                    data['error'].append(dv.error)
+                    data['error_style'].append(dv.errorStyle)
 
     finally:
-        wb.close()
+        if close_workbook:
+            wb.close()
 
     # Convert to DataFrame with proper columns even if empty
-    if not validation_list:
+    if not data['sheet']:
         # Return empty DataFrame with correct column structure
-        expected_columns = [
-            'sheet', 'ref', 'type', 'operator', 'formula1', 'formula2',
-            'allow_blank', 'show_input_message', 'show_error_message',
-            'prompt_title', 'prompt', 'error_title', 'error', 'error_style'
-        ]
-        return pd.DataFrame(columns=expected_columns)
-
-    df = pd.DataFrame(validation_list)
-
-    # Sort by sheet, then by ref
-    df = df.sort_values(['sheet', 'ref']).reset_index(drop=True)
-
-    return df
+        return pd.DataFrame(columns=_VALIDATION_COLUMNS)
+
+    # Order by (sheet, ref) before the frame is built: one Python sort
+    # over two small key lists replaces sort_values' object-dtype
+    # comparisons and the full-frame take. Rules without a target range
+    # sort last, matching sort_values' NaN placement.
+    n = len(data['sheet'])
+    order = sorted(range(n), key=lambda i: (data['sheet'][i],
+                                            data['ref'][i] is None,
+                                            data['ref'][i] or ''))
+    if order != list(range(n)):
+        data = {name: [values[i] for i in order] for name, values in data.items()}
+
+    return pd.DataFrame(data)
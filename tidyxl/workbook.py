@@ -2,11 +2,30 @@
 Workbook-level functionality for sheet names and metadata
 """
 
+import os
 import re
-from typing import List
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from xml.etree import ElementTree
 
 import pandas as pd
-from openpyxl import load_workbook
+
+from ._cache import CACHE_MAXSIZE, check_file_type, file_stamp
+
+# Compiled once: matches a single cell or a cell range, each part with
+# optional absolute markers. One alternation-free pattern replaces the
+# four per-call re.match passes this check used to interpret.
+_CELL_RANGE_RE = re.compile(r'^\$?[A-Z]+\$?\d+(?::\$?[A-Z]+\$?\d+)?$')
+
+# Characters that can never appear in a cell range reference but are
+# typical of real formulas; one C-level disjointness scan rejects those
+# without entering the regex engine
+_NON_RANGE_CHARS = frozenset('(),+-*/ =&"\'%')
+
+# Canonical column order of the defined-names schema
+_NAME_COLUMNS = ['sheet', 'name', 'formula', 'comment', 'hidden', 'is_range']
 
 
 def xlsx_sheet_names(path: str, check_filetype: bool = True) -> List[str]:
@@ -31,16 +50,22 @@ def xlsx_sheet_names(path: str, check_filetype: bool = True) -> List[str]:
 
     # Check file type if requested
     if check_filetype:
-        if not path.lower().endswith(('.xlsx', '.xlsm')):
-            raise ValueError("File must be .xlsx or .xlsm format")
+        check_file_type(path)
 
-    # Load workbook (read-only for efficiency)
-    wb = load_workbook(filename=path, read_only=True, data_only=False)
+    return list(_sheet_names_cached(file_stamp(path)))
 
-    try:
-        return wb.sheetnames
-    finally:
-        wb.close()
+
+@lru_cache(maxsize=CACHE_MAXSIZE)
+def _sheet_names_cached(stamp) -> Tuple[str, ...]:
+    """Parse and cache the sheet names of one file stamp."""
+
+    # The sheet list lives in one small zip member (xl/workbook.xml), so
+    # read just that instead of loading a workbook object graph
+    with zipfile.ZipFile(stamp[0]) as zf, zf.open('xl/workbook.xml') as fh:
+        root = ElementTree.parse(fh).getroot()
+
+    return tuple(sheet.get('name')
+                 for sheet in root.find('{*}sheets').iterfind('{*}sheet'))
 
 
 def xlsx_names(path: str, check_filetype: bool = True) -> pd.DataFrame:
@@ -71,61 +96,153 @@ def xlsx_names(path: str, check_filetype: bool = True) -> pd.DataFrame:
 
     # Check file type if requested
     if check_filetype:
-        if not path.lower().endswith(('.xlsx', '.xlsm')):
-            raise ValueError("File must be .xlsx or .xlsm format")
+        check_file_type(path)
+
+    # Copy on cache hit so callers can mutate their frame freely
+    return _names_cached(file_stamp(path)).copy()
+
 
-    # Load workbook
-    wb = load_workbook(filename=path, data_only=False)
+@lru_cache(maxsize=CACHE_MAXSIZE)
+def _names_cached(stamp) -> pd.DataFrame:
+    """Parse and cache the defined names of one file stamp."""
 
-    names_list = []
+    # Defined names live in xl/workbook.xml alongside the sheet list, so
+    # parse that one zip member directly instead of building a workbook
+    # object graph. This also picks up sheet-scoped names, which the
+    # workbook graph only exposes per worksheet.
+    sheet_names = _sheet_names_cached(stamp)
+
+    with zipfile.ZipFile(stamp[0]) as zf, zf.open('xl/workbook.xml') as fh:
+        root = ElementTree.parse(fh).getroot()
+
+    defined_names = root.find('{*}definedNames')
+    if defined_names is None:
+        # Data-only workbooks usually define no names at all: skip the
+        # accumulation and sort machinery and return the bare schema
+        return pd.DataFrame(columns=_NAME_COLUMNS)
+
+    data: Dict[str, List[Any]] = {name: [] for name in _NAME_COLUMNS}
+    for element in defined_names.iterfind('{*}definedName'):
+        local_sheet_id = element.get('localSheetId')
+        sheet_name = None
+        if local_sheet_id is not None and int(local_sheet_id) < len(sheet_names):
+            sheet_name = sheet_names[int(local_sheet_id)]
+
+        formula_text = element.text or ""
+        hidden = element.get('hidden')
+
+        data['sheet'].append(sheet_name)
+        data['name'].append(element.get('name'))
+        data['formula'].append(formula_text)
+        data['comment'].append(element.get('comment'))
+        data['hidden'].append(hidden in ('1', 'true') if hidden is not None else None)
+        data['is_range'].append(_is_cell_range(formula_text))
+
+    return _names_frame(data)
+
+
+def xlsx_names_many(paths: List[str], max_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Import named formulas from several xlsx (Excel) files at once.
+
+    Per-file extraction is independent, so the files are parsed in
+    parallel worker processes and the per-file frames are concatenated
+    once at the end, keyed by path.
+
+    Parameters
+    ----------
+    paths : list of str
+        Paths to the Excel files (.xlsx or .xlsm)
+    max_workers : int, or None
+        Worker process count. Defaults to one per file, capped at the
+        CPU count.
+
+    Returns
+    -------
+    pd.DataFrame
+        The xlsx_names frames of all files, stacked under a two-level
+        index whose first level ('path') is the source file.
+    """
+
+    paths = list(paths)
+    if not paths:
+        return pd.DataFrame(columns=_NAME_COLUMNS)
+
+    if max_workers is None:
+        max_workers = min(len(paths), os.cpu_count() or 1)
+
+    if len(paths) == 1 or max_workers == 1:
+        # Pool startup costs more than it saves on a single file
+        frames = [xlsx_names(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(xlsx_names, paths))
+
+    return pd.concat(frames, keys=paths, names=['path'])
+
+
+def _names_from_workbook(wb, close_workbook: bool = False) -> pd.DataFrame:
+    """
+    Extract defined names from an already-loaded openpyxl workbook.
+
+    Shared implementation behind xlsx_names and XlsxBook.names.
+    """
+
+    data: Dict[str, List[Any]] = {name: [] for name in _NAME_COLUMNS}
+
+    # The workbook-level dict holds only globally scoped names; names
+    # with a localSheetId live on their worksheet's own dict, so both
+    # levels have to be walked to match what xlsx_names reads from the
+    # XML. Scope comes from the owning dict, not from a sheet-id lookup.
+    scopes = [(None, wb.defined_names)]
+    scopes.extend((ws.title, ws.defined_names) for ws in wb.worksheets)
 
     try:
-        # Get defined names from workbook
-        for name, defined_name in wb.defined_names.items():
-            # Determine if it's sheet-specific or global
-            sheet_name = None
-            if hasattr(defined_name, 'localSheetId') and defined_name.localSheetId is not None:
-                # Get sheet name by index
-                sheet_names = wb.sheetnames
-                if defined_name.localSheetId < len(sheet_names):
-                    sheet_name = sheet_names[defined_name.localSheetId]
-
-            # Check if it's a range (contains cell references) vs formula
-            formula_text = str(defined_name.attr_text) if hasattr(defined_name, 'attr_text') and defined_name.attr_text else ""
-            is_range = _is_cell_range(formula_text)
-
-            name_record = {
-                'sheet': sheet_name,
-                'name': name,
-                'formula': formula_text,
-                'comment': getattr(defined_name, 'comment', None),
-                'hidden': getattr(defined_name, 'hidden', False),
-                'is_range': is_range
-            }
-
-            names_list.append(name_record)
+        for sheet_name, defined_names in scopes:
+            for name, defined_name in defined_names.items():
+                # Check if it's a range (contains cell references) vs
+                # formula; attr_text is already a string (or None) in
+                # openpyxl, so no str() copy is needed
+                formula_text = getattr(defined_name, 'attr_text', None) or ""
+
+                data['sheet'].append(sheet_name)
+                data['name'].append(name)
+                data['formula'].append(formula_text)
+                data['comment'].append(getattr(defined_name, 'comment', None))
+                data['hidden'].append(getattr(defined_name, 'hidden', None))
+                data['is_range'].append(_is_cell_range(formula_text))
 
     finally:
-        wb.close()
+        if close_workbook:
+            wb.close()
+
+    return _names_frame(data)
 
-    # Convert to DataFrame with proper columns even if empty
-    if not names_list:
-        # Return empty DataFrame with correct column structure
-        return pd.DataFrame(columns=['sheet', 'name', 'formula', 'comment', 'hidden', 'is_range'])
 
-    df = pd.DataFrame(names_list)
+def _names_frame(data: Dict[str, List[Any]]) -> pd.DataFrame:
+    """Assemble and sort the columnar defined-names data."""
 
-    # Sort by sheet (global first), then by name
-    df['_sort_key'] = df['sheet'].fillna('')  # Global names first
-    df = df.sort_values(['_sort_key', 'name']).drop('_sort_key', axis=1).reset_index(drop=True)
+    # Sort by sheet (global names first, via the empty-string key), then
+    # by name — on the column lists, before the frame exists, so no
+    # helper sort column or object-dtype sort_values pass is needed
+    n = len(data['name'])
+    order = sorted(range(n), key=lambda i: (data['sheet'][i] or '', data['name'][i]))
+    if order != list(range(n)):
+        data = {name: [values[i] for i in order] for name, values in data.items()}
 
-    return df
+    # The explicit column list keeps the schema in place when the
+    # workbook defines no names
+    return pd.DataFrame(data, columns=_NAME_COLUMNS)
 
 
+@lru_cache(maxsize=1024)
 def _is_cell_range(formula_text: str) -> bool:
     """
     Check if a formula represents a cell range vs a complex formula.
 
+    Pure string-to-bool, so results are memoized: defined names across
+    related workbooks frequently repeat the same reference templates.
+
     Parameters
     ----------
     formula_text : str
@@ -140,15 +257,16 @@ def _is_cell_range(formula_text: str) -> bool:
     if not formula_text:
         return False
 
-    # Remove sheet references for analysis
-    clean_formula = re.sub(r'^[^!]*!', '', formula_text)
+    # Remove sheet references for analysis (the prefix itself may hold
+    # spaces and quotes, so it goes before the character filter). '!' is
+    # the qualifier separator and never part of a sheet name, so a plain
+    # partition does what the old prefix regex did.
+    _, sep, after = formula_text.partition('!')
+    clean_formula = (after if sep else formula_text).strip()
 
-    # Simple patterns that indicate cell ranges
-    range_patterns = [
-        r'^[A-Z]+\d+$',  # Single cell (e.g., A1)
-        r'^[A-Z]+\d+:[A-Z]+\d+$',  # Range (e.g., A1:B10)
-        r'^\$?[A-Z]+\$?\d+$',  # Absolute single cell
-        r'^\$?[A-Z]+\$?\d+:\$?[A-Z]+\$?\d+$',  # Absolute range
-    ]
+    # References containing operators, parens or quoting can't be
+    # ranges; reject those without entering the regex engine
+    if not _NON_RANGE_CHARS.isdisjoint(clean_formula):
+        return False
 
-    return any(re.match(pattern, clean_formula.strip()) for pattern in range_patterns)
+    return bool(_CELL_RANGE_RE.match(clean_formula))